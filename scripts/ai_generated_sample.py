@@ -5,9 +5,46 @@ various types of input data with robust error handling and validation.
 
 import json
 import logging
-from typing import List, Dict, Any, Optional, Union
+import sys
+from collections import defaultdict
+from typing import List, Dict, Any, Callable, Optional, Tuple, Union
 from datetime import datetime
 
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Minimum batch size before homogeneous numeric columns are routed
+# through the compiled kernel instead of the per-value object path.
+NUMERIC_FAST_PATH_MIN_ITEMS = 1000
+
+
+if njit is not None:
+    @njit(cache=True, nogil=True)
+    def _clamp_nonneg(values):
+        """
+        Clamp negative entries of a numeric array to zero in place.
+        
+        Args:
+            values: One-dimensional int64 or float64 array
+            
+        Returns:
+            The same array with negative entries replaced by zero
+        """
+        for i in range(values.shape[0]):
+            if values[i] < 0:
+                values[i] = 0
+        return values
+
 
 class DataProcessor:
     """
@@ -26,6 +63,15 @@ class DataProcessor:
         """
         self.config = self.validate_config(config)
         self.logger = self.setup_logger()
+        self._dispatch = {
+            str: self._strip,
+            int: self._clamp,
+            float: self._clamp,
+            list: self._filter_none,
+        }
+        self._process_string_items = self.compile_string_processor(
+            tuple(self.config['string_cols'])
+        )
         
     def validate_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -49,22 +95,89 @@ class DataProcessor:
         if 'max_retries' not in config:
             config['max_retries'] = 3
             
+        if 'string_cols' not in config:
+            config['string_cols'] = []
+        
+        string_cols = config['string_cols']
+        
+        if not isinstance(string_cols, list) or not all(type(col) is str for col in string_cols):
+            raise ValueError("string_cols must be a list of strings")
+        
+        config['string_cols'] = list(dict.fromkeys(string_cols))
+            
         return config
     
+    def compile_string_processor(
+        self, string_cols: Tuple[str, ...]
+    ) -> Optional[Callable[[List[Dict[str, Any]], str], Optional[List[Dict[str, Any]]]]]:
+        """
+        Generate a specialized batch processor for a known string schema.
+        
+        The generated function builds each processed dictionary with
+        straight-line code, with no per-key type dispatch. It returns None
+        as soon as an item is not a dict with exactly these keys in this
+        order, or a value is not exactly a str, so the caller can fall
+        back to the general path.
+        
+        Args:
+            string_cols: Column names of items made up only of string values
+            
+        Returns:
+            Generated processor taking a list of items and a timestamp, or
+            None if no string columns are configured
+        """
+        if len(string_cols) == 0:
+            return None
+        
+        names = [f"value_{index}" for index in range(len(string_cols))]
+        loads = "".join(
+            f"        {name} = item[{key!r}]\n" for name, key in zip(names, string_cols)
+        )
+        checks = " or ".join(f"type({name}) is not str" for name in names)
+        fields = "".join(
+            f"{key!r}: {name}.strip(), " for name, key in zip(names, string_cols)
+        )
+        source = (
+            "def process_string_items(data, processed_at):\n"
+            "    processed = []\n"
+            "    append = processed.append\n"
+            "    for item in data:\n"
+            "        if type(item) is not dict or tuple(item) != string_cols:\n"
+            "            return None\n"
+            f"{loads}"
+            f"        if {checks}:\n"
+            "            return None\n"
+            f"        append({{{fields}'processed_at': processed_at}})\n"
+            "    return processed\n"
+        )
+        
+        namespace: Dict[str, Any] = {'string_cols': string_cols}
+        exec(source, namespace)
+        
+        return namespace['process_string_items']
+    
     def setup_logger(self) -> logging.Logger:
         """
         Set up logging configuration for the processor.
         
+        The handler is only attached once, so creating several processors
+        does not emit every record multiple times.
+        
         Returns:
             Configured logger instance
         """
         logger = logging.getLogger(__name__)
+        
+        if logger.handlers:
+            return logger
+        
         logger.setLevel(logging.INFO)
         
         handler = logging.StreamHandler()
         formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         handler.setFormatter(formatter)
         logger.addHandler(handler)
+        logger.propagate = False
         
         return logger
     
@@ -72,6 +185,11 @@ class DataProcessor:
         """
         Process a list of data dictionaries with comprehensive validation.
         
+        Items matching the configured string columns go through the
+        generated processor; otherwise the data is processed column by
+        column and then re-materialized into dictionaries that keep each
+        item's original key order.
+        
         Args:
             data: List of dictionaries to process
             
@@ -82,50 +200,233 @@ class DataProcessor:
             TypeError: If input data is not a list
             ValueError: If data contains invalid items
         """
-        if not isinstance(data, list):
-            raise TypeError("Input data must be a list")
+        processed_at = datetime.now().isoformat()
         
-        if len(data) == 0:
-            return []
+        if self._process_string_items is not None and isinstance(data, list):
+            processed_data = self._process_string_items(data, processed_at)
+            
+            if processed_data is not None:
+                return processed_data
         
+        columns = self.process_columns(data)
+        cursors = {key: iter(values) for key, values in columns.items()}
         processed_data = []
         
+        for item in data:
+            processed_item = {
+                key: next(cursors[key]) for key, value in item.items() if value is not None
+            }
+            processed_item['processed_at'] = processed_at
+            processed_data.append(processed_item)
+        
+        return processed_data
+    
+    def process_data_columnar(self, data: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+        """
+        Process a list of data dictionaries into a columnar layout.
+        
+        Every key found in any item becomes a column with one entry per
+        item. Missing and None values are kept as None so that all
+        columns stay aligned with the input.
+        
+        Args:
+            data: List of dictionaries to process
+            
+        Returns:
+            Mapping of column name to processed values, including a
+            'processed_at' column
+            
+        Raises:
+            TypeError: If input data is not a list
+            ValueError: If data contains invalid items
+        """
+        columns = self.process_columns(data)
+        
+        if len(data) == 0:
+            return {}
+        
+        dense = {key: [None] * len(data) for key in columns}
+        cursors = {key: iter(values) for key, values in columns.items()}
+        
+        for index, item in enumerate(data):
+            for key, value in item.items():
+                if value is not None:
+                    dense[key][index] = next(cursors[key])
+        
+        processed_at = datetime.now().isoformat()
+        dense['processed_at'] = [processed_at] * len(data)
+        
+        return dense
+    
+    def process_columns(self, data: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+        """
+        Gather and process the present values of every key, column by column.
+        
+        Every key found in any item gets a column, but a column only holds
+        the non-None values of its key in item order, so the work stays
+        proportional to the number of entries even when items have very
+        different keys.
+        
+        Args:
+            data: List of dictionaries to process
+            
+        Returns:
+            Mapping of column name to processed values in item order
+            
+        Raises:
+            TypeError: If input data is not a list
+            ValueError: If data contains invalid items
+        """
+        if not isinstance(data, list):
+            raise TypeError("Input data must be a list")
+        
+        columns: Dict[str, List[Any]] = defaultdict(list)
+        
         for item in data:
             if not isinstance(item, dict):
                 raise ValueError("All items must be dictionaries")
             
-            processed_item = self.process_item(item)
-            processed_data.append(processed_item)
+            for key, value in item.items():
+                column = columns[key]
+                
+                if value is not None:
+                    column.append(value)
         
-        return processed_data
+        return {key: self.process_column(values) for key, values in columns.items()}
+    
+    def process_column(self, column: List[Any]) -> List[Any]:
+        """
+        Process a single column of values using a type-specialized path.
+        
+        Columns holding one exact type (str, int, float or list) are
+        processed in bulk; mixed columns fall back to per-value dispatch.
+        
+        Args:
+            column: Present (non-None) values of one key, in item order
+            
+        Returns:
+            Processed column values
+        """
+        value_types = set(map(type, column))
+        
+        if len(value_types) != 1:
+            return [self.process_value(value) for value in column]
+        
+        value_type = value_types.pop()
+        
+        if value_type is str:
+            return [value.strip() for value in column]
+        
+        if value_type is int or value_type is float:
+            processed = self.process_numeric_column(column, value_type)
+            
+            if processed is not None:
+                return processed
+            
+            return [0 if value < 0 else value for value in column]
+        
+        if value_type is list:
+            return [[entry for entry in value if entry is not None] for value in column]
+        
+        return [self.process_value(value) for value in column]
+    
+    def process_numeric_column(
+        self, column: List[Union[int, float]], value_type: type
+    ) -> Optional[List[Union[int, float]]]:
+        """
+        Process a homogeneous numeric column with the compiled kernel.
+        
+        The fast path only applies when numba is available and the column
+        is large enough to amortize the array conversion.
+        
+        Args:
+            column: Column values, all of the exact type value_type
+            value_type: Either int or float
+            
+        Returns:
+            Processed column values, or None if the fast path does not apply
+        """
+        if njit is None or len(column) < NUMERIC_FAST_PATH_MIN_ITEMS:
+            return None
+        
+        dtype = np.int64 if value_type is int else np.float64
+        
+        try:
+            values = np.asarray(column, dtype=dtype)
+        except OverflowError:
+            return None
+        
+        negative = np.flatnonzero(values < 0)
+        processed = _clamp_nonneg(values).tolist()
+        
+        # The object path clamps negative floats to an int zero
+        if value_type is float:
+            for index in negative:
+                processed[index] = 0
+        
+        return processed
     
-    def process_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
+    def process_item(
+        self, item: Dict[str, Any], processed_at: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Process a single data item with validation and transformation.
         
         Args:
             item: Dictionary item to process
+            processed_at: Optional ISO timestamp to stamp the item with,
+                so callers processing many items can share one
             
         Returns:
             Processed dictionary item
         """
+        if processed_at is None:
+            processed_at = datetime.now().isoformat()
+        
+        if self._process_string_items is not None:
+            processed_items = self._process_string_items([item], processed_at)
+            
+            if processed_items is not None:
+                return processed_items[0]
+        
         processed_item = {}
         
         for key, value in item.items():
             if value is not None:
-                if isinstance(value, str):
-                    processed_item[key] = self.process_string_value(value)
-                elif isinstance(value, (int, float)):
-                    processed_item[key] = self.process_numeric_value(value)
-                elif isinstance(value, list):
-                    processed_item[key] = self.process_list_value(value)
-                else:
-                    processed_item[key] = value
+                processed_item[key] = self.process_value(value)
         
-        processed_item['processed_at'] = datetime.now().isoformat()
+        processed_item['processed_at'] = processed_at
         
         return processed_item
     
+    def process_value(self, value: Any) -> Any:
+        """
+        Process a single value according to its type.
+        
+        Args:
+            value: Value to process
+            
+        Returns:
+            Processed value, or the value unchanged if its type is not handled
+        """
+        if value is None:
+            return None
+        
+        handler = self._dispatch.get(type(value))
+        
+        if handler is not None:
+            return handler(value)
+        
+        # Subclasses of the handled types are not in the dispatch table
+        if isinstance(value, str):
+            return self._strip(value)
+        elif isinstance(value, (int, float)):
+            return self._clamp(value)
+        elif isinstance(value, list):
+            return self._filter_none(value)
+        
+        return value
+    
     def process_string_value(self, value: str) -> str:
         """
         Process string values with proper validation and cleaning.
@@ -139,12 +440,7 @@ class DataProcessor:
         if not isinstance(value, str):
             raise TypeError("Value must be a string")
         
-        processed_value = value.strip()
-        
-        if len(processed_value) == 0:
-            return ""
-        
-        return processed_value
+        return self._strip(value)
     
     def process_numeric_value(self, value: Union[int, float]) -> Union[int, float]:
         """
@@ -159,10 +455,7 @@ class DataProcessor:
         if not isinstance(value, (int, float)):
             raise TypeError("Value must be numeric")
         
-        if value < 0:
-            return 0
-        
-        return value
+        return self._clamp(value)
     
     def process_list_value(self, value: List[Any]) -> List[Any]:
         """
@@ -177,16 +470,83 @@ class DataProcessor:
         if not isinstance(value, list):
             raise TypeError("Value must be a list")
         
-        if len(value) == 0:
-            return []
+        return self._filter_none(value)
+    
+    def _strip(self, value: str) -> str:
+        """
+        Strip surrounding whitespace from a string without validation.
         
-        processed_list = []
+        Args:
+            value: String value already known to be a str
+            
+        Returns:
+            Stripped string value
+        """
+        return value.strip()
+    
+    def _clamp(self, value: Union[int, float]) -> Union[int, float]:
+        """
+        Clamp a numeric value to be non-negative without validation.
         
-        for item in value:
-            if item is not None:
-                processed_list.append(item)
+        Args:
+            value: Numeric value already known to be an int or float
+            
+        Returns:
+            Value clamped to zero if negative
+        """
+        if value < 0:
+            return 0
+        
+        return value
+    
+    def _filter_none(self, value: List[Any]) -> List[Any]:
+        """
+        Drop None entries from a list without validation.
         
-        return processed_list
+        Args:
+            value: List value already known to be a list
+            
+        Returns:
+            New list without None entries
+        """
+        # Measured faster than filter(partial(operator.is_not, None), value),
+        # and a NumPy mask would need an object array and could change types
+        return [item for item in value if item is not None]
+
+
+def write_json(result: Any) -> None:
+    """
+    Write a result to standard output as indented JSON.
+    
+    Uses orjson when it is installed and can encode the result, writing the
+    encoded bytes straight to the binary stdout buffer when there is one;
+    otherwise falls back to the standard library encoder. The orjson output
+    matches json.dumps(indent=2) for plain payloads like the demo data, but
+    differs in a few cases: NaN and infinities become null, non-ASCII text
+    is written as UTF-8 rather than \\u escapes, and some floats are
+    formatted differently (1e16 rather than 1e+16).
+    
+    Args:
+        result: JSON-serializable value to write
+    """
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            buffer = getattr(sys.stdout, 'buffer', None)
+            
+            if buffer is None:
+                sys.stdout.write(encoded.decode())
+                return
+            
+            sys.stdout.flush()
+            buffer.write(encoded)
+            buffer.flush()
+            return
+    
+    print(json.dumps(result, indent=2))
 
 
 def main() -> None:
@@ -207,7 +567,7 @@ def main() -> None:
     
     try:
         result = processor.process_data(sample_data)
-        print(json.dumps(result, indent=2))
+        write_json(result)
     except Exception as error:
         print(f"Error processing data: {error}")
 
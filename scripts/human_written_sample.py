@@ -1,50 +1,217 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import re
+import mmap
+import os
 import sys
-from collections import defaultdict
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# re2 is linear time so long/garbage lines can't blow up the backtracker
+# (pip install google-re2), plain re works fine if it's not there
+try:
+    import re2 as re
+except ImportError:
+    import re
 
 # TODO: refactor this mess when I have time
 # HACK: using global state because deadline is tomorrow
 
-stats = defaultdict(int)
+stats = Counter()
 DEBUG = True
 
+# below this it's faster to just do it in one process than to start a pool
+PARALLEL_MIN_BYTES = 64 << 20
+# main only ever prints this many errors, no point keeping the rest around
+MAX_SHOWN = 10
+# newlines get counted this many bytes at a time off the mmap
+_NL_WINDOW = 1 << 20
+
+# regex I found on stackoverflow, seems to work
+# compiled once up here so we don't pay for it on every line
+# (?m)^ so it anchors at every line start when we scan the whole file in one go
+# the whitespace bits on both ends do what line.strip() used to: indented lines
+# still parse and the msg doesn't keep trailing spaces (or the \r from \r\n)
+# NOTE: it's a bytes regex so \w and \S are ascii only, unlike the old str one.
+# a non-ascii level like [ÉRROR] doesn't parse anymore and non-ascii whitespace
+# (e.g. a trailing \xa0) stays in the msg instead of getting stripped
+_LOG_LINE = rb'[ \t\r\f\v]*(\d{4}-\d{2}-\d{2}) (\d{2}:\d{2}:\d{2}) \[(\w+)\] ([^\n]*\S)[ \t\r\f\v]*$'
+_LOG_RE = re.compile(rb'(?m)^' + _LOG_LINE)
+# same thing but anything else with a [ in it comes back as group 5, so DEBUG
+# can still complain about lines it couldn't parse without a second pass
+_DEBUG_RE = re.compile(rb'(?m)^(?:' + _LOG_LINE + rb'|([^\n]*\[[^\n]*))')
+# still a tuple so unpacking works, just with names
+Entry = namedtuple('Entry', 'date time level msg')
+
+# known levels -> interned str, used when turning the raw bytes level into the
+# str that ends up in stats and Entry. the per-line count stays keyed by the raw
+# bytes, interning there measured no faster since the fresh bytes needs hashing anyway
+_LEVELS = {s.encode(): sys.intern(s) for s in ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')}
+
+def _level(raw):
+    # \w+ on bytes is ascii only (see the NOTE on _LOG_LINE) so this can't fail
+    return _LEVELS.get(raw) or sys.intern(raw.decode('ascii'))
+
+
 def parse_log_line(line):
-    # regex I found on stackoverflow, seems to work
-    pattern = r'(\d{4}-\d{2}-\d{2}) (\d{2}:\d{2}:\d{2}) \[(\w+)\] (.+)'
-    m = re.match(pattern, line.strip())
+    # single line version, analyze_logs doesn't use this anymore
+    raw = line.encode('utf-8') if isinstance(line, str) else line
+    m = _LOG_RE.match(raw)
     
     if not m:
         if DEBUG: print(f"couldn't parse: {line[:50]}...")
         return None
         
-    return {
-        'date': m.group(1),
-        'time': m.group(2), 
-        'level': m.group(3),
-        'msg': m.group(4)
-    }
-
-def analyze_logs(filename):
+    return Entry(*(g.decode('utf-8', 'replace') for g in m.groups()))
+
+def _count_newlines(buf, start, end):
+    if isinstance(buf, bytes):
+        return buf.count(b'\n', start, end)
+    # mmap has no .count(), and slicing the whole gap would copy it all onto
+    # the heap - a fixed size window at a time keeps that bounded
+    n = 0
+    for pos in range(start, end, _NL_WINDOW):
+        n += buf[pos:min(pos + _NL_WINDOW, end)].count(b'\n')
+    return n
+
+def _print_note(kind, line, text):
+    if kind == 'parse':
+        print(f"couldn't parse: {text[:50]}...")
+    else:
+        print(f"Line {line}: possible memory issue - {text[:100]}")
+
+def _scan(buf, start=0, end=None, limit=MAX_SHOWN, debug=False, emit=None, count_lines=False):
+    # scans buf[start:end], which has to start at a line start
+    # returns (level counts, error count, first `limit` errors, notes to print,
+    # newlines seen) with line numbers relative to start so chunks can be
+    # stitched back together. limit=None keeps every error. newlines seen is
+    # only worked out with count_lines, otherwise it's None
+    # notes go straight to emit(kind, line, text) if given (so the single process
+    # path prints as it goes), otherwise they're kept for the caller to print
+    if end is None: end = len(buf)
+    counts = Counter()
+    error_count = 0
     errors = []
+    notes = None
+    if emit is None:
+        notes = []  # (kind, line, text) in file order, text already cut to what gets printed
+        emit = lambda *note: notes.append(note)
     
+    # line numbers only matter when we report something, so count
+    # newlines lazily from wherever we counted up to last time
+    last_pos, last_line = start, 1
+    
+    # one pass, the regex engine finds the lines and we just look at each match
+    for m in (_DEBUG_RE if debug else _LOG_RE).finditer(buf, start, end):
+        raw, msg = m.group(3, 4)
+        if raw is None:
+            # only _DEBUG_RE gets here: a line with a [ that isn't a log line
+            # only 50 chars get printed, 200 bytes covers that even for 4-byte utf-8
+            text = m.group(5)[:200].rstrip(b'\r') + (b'\n' if m.end() < end else b'')
+            emit('parse', None, text.decode('utf-8', 'replace')[:50])
+            continue
+        counts[raw] += 1
+        
+        # stay in bytes here, only decode the lines we actually report
+        # tried a (?i)error|memory regex on the msg instead of lower() + in,
+        # it was slower or no better here, so plain substring checks it is
+        msg_lower = msg.lower()  # only lowercase once
+        is_error = raw == b'ERROR' or b'error' in msg_lower  # cheap level check first
+        is_memory = b'memory' in msg_lower
+        if not (is_error or is_memory): continue
+        
+        if is_error:
+            error_count += 1
+        keep = is_error and (limit is None or len(errors) < limit)
+        if not (keep or is_memory): continue
+        
+        last_line += _count_newlines(buf, last_pos, m.start())
+        last_pos = m.start()
+        msg = msg.decode('utf-8', 'replace')
+        
+        # look for suspicious stuff
+        if keep:
+            errors.append((last_line, Entry(m.group(1).decode(), m.group(2).decode(), _level(raw), msg)))
+            
+        # quick hack for memory issues
+        if is_memory:
+            emit('memory', last_line, msg[:100])
+    
+    # the rest of the chunk only matters for offsetting the chunks after it
+    newlines = None
+    if count_lines:
+        newlines = last_line - 1 + _count_newlines(buf, last_pos, end)
+    return counts, error_count, errors, notes, newlines
+
+def _scan_range(filename, start, end, limit, debug):
+    # runs in a worker - map the file again here so we only ship offsets
+    # over to the pool and never the actual log contents
+    with open(filename, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            return _scan(buf, start, end, limit, debug, count_lines=True)
+
+def _scan_parallel(filename, buf, limit, debug):
+    workers = os.cpu_count() or 1
+    size = len(buf)
+    step = size // workers
+    
+    # cut roughly every step bytes, pushed forward to just after a newline
+    cuts = [0]
+    for i in range(1, workers):
+        nl = buf.find(b'\n', max(i * step, cuts[-1]))
+        if nl == -1: break
+        cuts.append(nl + 1)
+    cuts.append(size)
+    cuts = sorted(set(cuts))
+    
+    n = len(cuts) - 1
+    with ProcessPoolExecutor(max_workers=n) as pool:
+        return list(pool.map(_scan_range, [filename] * n, cuts[:-1], cuts[1:], [limit] * n, [debug] * n))
+
+def analyze_logs(filename, collect_all=False):
+    # returns (error_total, errors) - errors only has the first MAX_SHOWN
+    # unless collect_all is set
+    limit = None if collect_all else MAX_SHOWN
+    debug = DEBUG  # workers import the module fresh, so pass it along
     try:
-        with open(filename, 'r') as f:
-            for i, line in enumerate(f):
-                entry = parse_log_line(line)
-                if not entry: continue
-                
-                stats[entry['level']] += 1
-                
-                # look for suspicious stuff
-                if 'error' in entry['msg'].lower() or entry['level'] == 'ERROR':
-                    errors.append((i+1, entry))
-                    
-                # quick hack for memory issues
-                if 'memory' in entry['msg'].lower():
-                    print(f"Line {i+1}: possible memory issue - {entry['msg'][:100]}")
+        # big buffer in case we end up reading instead of mapping
+        with open(filename, 'rb', buffering=1 << 20) as f:
+            try:
+                buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # empty file or a pipe, can't mmap those - just slurp it
+                chunks = [_scan(f.read(), limit=limit, debug=debug, emit=_print_note)]
+            else:
+                with buf:
+                    chunks = None
+                    if len(buf) >= PARALLEL_MIN_BYTES and (os.cpu_count() or 1) > 1:
+                        try:
+                            chunks = _scan_parallel(filename, buf, limit, debug)
+                        except (BrokenProcessPool, OSError, ImportError, NotImplementedError):
+                            # no working pool (worker died, sandbox without semaphores,
+                            # ...) - nothing got printed yet so just do it in here
+                            chunks = None
+                    if chunks is None:
+                        chunks = [_scan(buf, limit=limit, debug=debug, emit=_print_note)]
+        
+        # stitch chunks back together in file order
+        error_total = 0
+        errors = []
+        offset = 0
+        for counts, error_count, chunk_errors, notes, newlines in chunks:
+            # few distinct levels so decoding the keys here is nothing
+            for level, n in counts.items():
+                stats[_level(level)] += n
+            # only parallel chunks keep notes, the single scan already printed them
+            for kind, line, text in notes or ():
+                _print_note(kind, line if line is None else offset + line, text)
+            error_total += error_count
+            errors.extend((offset + line, entry) for line, entry in chunk_errors)
+            offset += newlines or 0  # None on the single chunk path, nothing after it anyway
+        if limit is not None:
+            del errors[limit:]
+        return error_total, errors
                     
     except FileNotFoundError:
         print(f"wtf, file {filename} doesn't exist")
@@ -52,8 +219,6 @@ def analyze_logs(filename):
     except Exception as e:
         print(f"something broke: {e}")
         return None
-        
-    return errors
 
 def main():
     if len(sys.argv) != 2:
@@ -63,15 +228,16 @@ def main():
     logfile = sys.argv[1]
     print(f"analyzing {logfile}...")
     
-    errors = analyze_logs(logfile)
+    result = analyze_logs(logfile)
     
-    if errors is None:
+    if result is None:
         print("failed to analyze logs")
         return
+    error_total, errors = result
         
-    print(f"\nFound {len(errors)} errors:")
-    for line_num, entry in errors[:10]:  # only show first 10
-        print(f"  Line {line_num}: [{entry['level']}] {entry['msg'][:80]}...")
+    print(f"\nFound {error_total} errors:")
+    for line_num, entry in errors[:MAX_SHOWN]:  # only show first 10
+        print(f"  Line {line_num}: [{entry.level}] {entry.msg[:80]}...")
         
     print(f"\nStats:")
     for level, count in sorted(stats.items()):